@@ -3,40 +3,70 @@
 import logging
 import requests
 import unicodedata
+from functools import lru_cache
 from typing import Dict, List
 
+from scraper.session import create_session
+
 logger = logging.getLogger(__name__)
 
 NTFY_TOPIC = "qub-ngo-funding"
 NTFY_URL = f"https://ntfy.sh/{NTFY_TOPIC}"
 
-
+# Reused across notifications in a run so ntfy.sh connections stay alive
+_SESSION = create_session()
+
+# Punctuation with no ASCII decomposition. Diacritics need no entries: NFKD splits
+# them into a base letter plus a combining mark, which the ASCII encode drops.
+_HEADER_TRANS = str.maketrans({
+    '\u2013': '-',
+    '\u2014': '-',
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u201c': '"',
+    '\u201d': '"',
+})
+
+SOURCE_NAMES = {
+    'finantare_ro': 'Finantare.ro',
+    'fonduri_structurale': 'Fonduri Structurale EU',
+    'afcn': 'AFCN - Fond Cultural National',
+    'fdsc': 'FDSC',
+    'active_citizens': 'Active Citizens Fund',
+}
+
+# Keywords listed first in a notification
+_HIGH_PRIORITY = frozenset({
+    'educatie', 'educatia', 'educational', 'steam', 'stiinta',
+    'tineret', 'tineri', 'copii', 'elevi', 'scoala', 'scoli',
+    'ngo', 'ong', 'societate civila', 'cultura', 'cultural',
+})
+
+# Keywords that raise a notification to ntfy's high priority
+_URGENT = frozenset({'educatie', 'educatia', 'steam', 'tineret', 'copii', 'ong'})
+
+# ntfy turns longer message bodies into attachments, so digests stay under this
+_MAX_MESSAGE_BYTES = 4000
+
+
+@lru_cache(maxsize=2048)
 def sanitize_header(text: str) -> str:
     """Sanitize text for HTTP headers (ASCII-safe)"""
-    text = unicodedata.normalize('NFKD', text)
-    replacements = {
-        '\u2013': '-',
-        '\u2014': '-',
-        '\u2018': "'",
-        '\u2019': "'",
-        '\u201c': '"',
-        '\u201d': '"',
-        '\u0103': 'a',  # ă
-        '\u00e2': 'a',  # â
-        '\u00ee': 'i',  # î
-        '\u0219': 's',  # ș
-        '\u021b': 't',  # ț
-        '\u0102': 'A',  # Ă
-        '\u00c2': 'A',  # Â
-        '\u00ce': 'I',  # Î
-        '\u0218': 'S',  # Ș
-        '\u021a': 'T',  # Ț
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    if text.isascii():
+        return text
+
+    # Quick Check first, so already-decomposed text is not copied again
+    if not unicodedata.is_normalized('NFKD', text):
+        text = unicodedata.normalize('NFKD', text)
+    text = text.translate(_HEADER_TRANS)
     return text.encode('ascii', 'ignore').decode('ascii')
 
 
+def is_urgent(matched_keywords: List[str]) -> bool:
+    """Whether any matched keyword warrants a high priority notification"""
+    return not _URGENT.isdisjoint(k.lower() for k in matched_keywords)
+
+
 def send_notification(funding: Dict, matched_keywords: List[str]) -> bool:
     """
     Send a push notification for a new funding opportunity via ntfy.sh
@@ -52,24 +82,14 @@ def send_notification(funding: Dict, matched_keywords: List[str]) -> bool:
         if funding.get('deadline'):
             lines.append(f"Termen limita: {funding['deadline']}")
 
-        source_names = {
-            'finantare_ro': 'Finantare.ro',
-            'fonduri_structurale': 'Fonduri Structurale EU',
-            'afcn': 'AFCN - Fond Cultural National',
-            'fdsc': 'FDSC',
-            'active_citizens': 'Active Citizens Fund',
-        }
-        source = source_names.get(funding.get('source'), funding.get('source', 'Necunoscut'))
+        source = SOURCE_NAMES.get(funding.get('source'), funding.get('source', 'Necunoscut'))
         lines.append(f"Sursa: {source}")
 
         if matched_keywords:
-            high_priority = [
-                'educatie', 'educatia', 'educational', 'steam', 'stiinta',
-                'tineret', 'tineri', 'copii', 'elevi', 'scoala', 'scoli',
-                'ngo', 'ong', 'societate civila', 'cultura', 'cultural',
-            ]
-            high = [k for k in matched_keywords if k.lower() in high_priority]
-            medium = [k for k in matched_keywords if k.lower() not in high_priority]
+            high = []
+            medium = []
+            for k in matched_keywords:
+                (high if k.lower() in _HIGH_PRIORITY else medium).append(k)
 
             if high:
                 lines.append(f"Prioritate ridicata: {', '.join(high)}")
@@ -78,14 +98,14 @@ def send_notification(funding: Dict, matched_keywords: List[str]) -> bool:
 
         message = "\n".join(lines)
 
-        response = requests.post(
+        response = _SESSION.post(
             NTFY_URL,
             data=message.encode('utf-8'),
             headers={
                 "Title": title,
                 "Click": funding.get('url', ''),
                 "Tags": "money_with_wings,romania",
-                "Priority": "high" if any(k.lower() in ['educatie', 'educatia', 'steam', 'tineret', 'copii', 'ong'] for k in matched_keywords) else "default"
+                "Priority": "high" if is_urgent(matched_keywords) else "default"
             },
             timeout=10
         )
@@ -102,10 +122,64 @@ def send_notification(funding: Dict, matched_keywords: List[str]) -> bool:
         return False
 
 
+def send_batch_notification(fundings: List[Dict]) -> int:
+    """
+    Send new funding opportunities as a single ntfy.sh digest instead of one push each.
+    Returns the number of opportunities delivered.
+    """
+    if not fundings:
+        return 0
+    if len(fundings) == 1:
+        funding = fundings[0]
+        return int(send_notification(funding, funding.get('matched_keywords', [])))
+
+    try:
+        lines = []
+        size = 0
+        for index, funding in enumerate(fundings):
+            entry = f"- {funding['title']}"
+            if funding.get('deadline'):
+                entry += f" (termen: {funding['deadline']})"
+            if funding.get('url'):
+                entry += f"\n  {funding['url']}"
+
+            entry_size = len(entry.encode('utf-8')) + 1
+            if size + entry_size > _MAX_MESSAGE_BYTES:
+                lines.append(f"...si inca {len(fundings) - index} oportunitati")
+                break
+            lines.append(entry)
+            size += entry_size
+
+        message = "\n".join(lines)
+        urgent = any(is_urgent(funding.get('matched_keywords', [])) for funding in fundings)
+
+        response = _SESSION.post(
+            NTFY_URL,
+            data=message.encode('utf-8'),
+            headers={
+                "Title": f"Finantare: {len(fundings)} oportunitati noi",
+                "Tags": "money_with_wings,romania",
+                "Priority": "high" if urgent else "default"
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+
+        logger.info(f"Digest notification sent for {len(fundings)} fundings")
+        return len(fundings)
+
+    except requests.RequestException as e:
+        logger.error(f"Failed to send digest notification: {e}")
+        return 0
+    except Exception as e:
+        logger.error(f"Error sending digest notification: {e}")
+        return 0
+
+
 def send_test_notification() -> bool:
     """Send a test notification to verify ntfy.sh is working"""
     try:
-        response = requests.post(
+        response = _SESSION.post(
             NTFY_URL,
             data="Aceasta este o notificare de test de la QUB NGO Funding Scraper.\n\nDaca vezi asta, notificarile functioneaza!",
             headers={
@@ -135,7 +209,7 @@ def send_summary_notification(new_count: int, total_matching: int) -> bool:
             title = f"QUB Funding - {new_count} oportunitati noi!"
             priority = "default"
 
-        response = requests.post(
+        response = _SESSION.post(
             NTFY_URL,
             data=message.encode('utf-8'),
             headers={
@@ -0,0 +1,70 @@
+"""Shared HTTP session setup with connection pooling, retries and an on-disk response cache"""
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+
+# Seconds a cached response is served without contacting the site. Once expired, responses
+# with an ETag or Last-Modified are revalidated with a conditional GET rather than refetched.
+LISTING_EXPIRE_AFTER = 1800
+DETAIL_EXPIRE_AFTER = 86400
+
+# Cached responses older than this are pruned after each scrape. requests-cache only
+# overwrites URLs that are requested again, so pages that left the listings would stay forever.
+CACHE_MAX_AGE = timedelta(days=7)
+
+
+def create_session(headers: Optional[Dict[str, str]] = None,
+                   cache_name: Optional[str] = None) -> requests.Session:
+    """
+    Create a requests Session that keeps connections alive between calls
+    and retries transient connection failures (idempotent requests only).
+    Each site keeps one session, so its listing and detail fetches share pooled
+    connections and default headers.
+    With a cache_name, GET responses are cached in an SQLite file under CACHE_DIR.
+    """
+    if cache_name:
+        session = CachedSession(
+            str(CACHE_DIR / cache_name),
+            backend='sqlite',
+            expire_after=DETAIL_EXPIRE_AFTER,
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def cache_options(session: requests.Session, expire_after: int) -> Dict[str, Any]:
+    """
+    Per-request cache keyword arguments for session.get. Only a CachedSession accepts
+    expire_after; a plain Session would raise TypeError, so it gets none.
+    """
+    if isinstance(session, CachedSession):
+        return {'expire_after': expire_after}
+    return {}
+
+
+def prune_cache(session: requests.Session) -> None:
+    """
+    Delete cached responses older than CACHE_MAX_AGE and vacuum the cache file. Merely
+    expired responses are kept, as their ETag/Last-Modified serve conditional revalidation.
+    """
+    if isinstance(session, CachedSession):
+        session.cache.delete(older_than=CACHE_MAX_AGE)
@@ -0,0 +1,143 @@
+"""Fetch and parse pipeline shared by the listing-plus-detail site scrapers"""
+
+import hashlib
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Pattern, Sequence
+
+import lxml.html
+import requests
+from bs4 import SoupStrainer
+from lxml import etree
+
+from scraper.session import DETAIL_EXPIRE_AFTER, LISTING_EXPIRE_AFTER, cache_options
+from scraper.sites._dateparse import parse_date
+
+logger = logging.getLogger(__name__)
+
+# Listing pages are only scanned for links, so only anchors are built into the tree
+LINKS_ONLY = SoupStrainer('a', href=True)
+
+# Detail pages are fetched concurrently, a few at a time to stay polite to the host
+DETAIL_WORKERS = 4
+
+# Detail pages are read up to this many bytes. Deadlines sit in the article body, which
+# can follow large inline <head> styles and scripts, so the cap only trims long tails.
+MAX_DETAIL_BYTES = 256 * 1024
+
+# Elements whose text is not page content (matches what BeautifulSoup's get_text skips)
+_NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+def find_deadline(deadline_patterns: Sequence[Pattern], text: str) -> Optional[str]:
+    """Return the date captured by the first deadline pattern, in order of preference, found in text"""
+    for pattern in deadline_patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def url_id(url: str) -> str:
+    """
+    Short stable ID for a URL. MD5 is kept (flagged as non-cryptographic) because
+    IDs are persisted in the seen database and the dashboard's applied/irrelevant state.
+    """
+    return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+def page_text(root) -> str:
+    """Visible text of an lxml element, whitespace-stripped per text node and space-joined"""
+    return ' '.join(filter(None, (chunk.strip() for chunk in root.itertext())))
+
+
+def declared_encoding(response: requests.Response) -> Optional[str]:
+    """
+    Charset named in the Content-Type header, to pass to the HTML parser with the raw body.
+    None when the header names none: requests would then assume ISO-8859-1 for text/html,
+    so the parser is left to take the encoding from the page's BOM or <meta charset>.
+    """
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+
+def text_root(html: bytes, encoding: Optional[str] = None):
+    """
+    Parse an HTML page with lxml and drop the elements whose text is not page content.
+    The body is always passed as bytes (lxml rejects str with an <?xml encoding?> prolog);
+    encoding, when given, overrides the page's BOM and <meta charset>.
+    """
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+    root = lxml.html.document_fromstring(html, parser=parser)
+    etree.strip_elements(root, *_NON_TEXT_TAGS, with_tail=False)
+    return root
+
+
+def fetch_listings(session: requests.Session, urls: Sequence[str]) -> List[Future]:
+    """
+    Request all listing pages together. Futures are returned in the order of urls
+    so callers can parse them deterministically; fetch errors surface from result().
+    """
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        listings = []
+        for url in urls:
+            logger.info(f"Fetching {url}")
+            listings.append(executor.submit(session.get, url, timeout=30,
+                                            **cache_options(session, LISTING_EXPIRE_AFTER)))
+    return listings
+
+
+def read_capped(response: requests.Response, limit: int) -> bytes:
+    """Read at most limit bytes of a streamed response body"""
+    chunks = []
+    total = 0
+    try:
+        for chunk in response.iter_content(chunk_size=16384):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= limit:
+                break
+    finally:
+        response.close()
+    return b''.join(chunks)[:limit]
+
+
+def fetch_page_details(session: requests.Session, url: str, deadline_patterns: Sequence[Pattern],
+                       find_content: Optional[Callable] = None) -> Dict:
+    """
+    Fetch a detail page for its deadline and description. find_content may pick
+    the element holding the main content; the whole page is used otherwise.
+    """
+    result = {'deadline': None, 'deadline_date': None, 'description': ''}
+    try:
+        response = session.get(url, timeout=15, stream=True, **cache_options(session, DETAIL_EXPIRE_AFTER))
+        response.raise_for_status()
+        # Detail pages only need their text, so lxml's C tree is used without bs4 wrappers
+        root = text_root(read_capped(response, MAX_DETAIL_BYTES), declared_encoding(response))
+
+        content = find_content(root) if find_content else None
+        text = page_text(content if content is not None else root)
+
+        result['description'] = ' '.join(text.split())[:3000]
+
+        date_str = find_deadline(deadline_patterns, text)
+        if date_str:
+            result['deadline'] = date_str
+            result['deadline_date'] = parse_date(date_str)
+
+        return result
+    except Exception as e:
+        logger.debug(f"Could not fetch details from {url}: {e}")
+        return result
+
+
+def fill_details(jobs: List[Dict], fetch: Callable[[str], Dict]) -> None:
+    """Fetch details for jobs concurrently and copy any deadline and description found"""
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+        for job, details in zip(jobs, executor.map(fetch, [job['url'] for job in jobs])):
+            if details['deadline']:
+                job['deadline'] = details['deadline']
+                job['deadline_date'] = details['deadline_date']
+            if details['description']:
+                job['description'] = details['description']
@@ -0,0 +1,49 @@
+"""Romanian deadline date parsing shared by the site scrapers"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+_NAMED_MONTH_RE = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})')
+
+# Numeric formats are told apart by shape instead of trying strptime on each in turn.
+# Day-first dates must use one separator throughout (15.04.2026, 15/04/2026, 15-04-2026).
+_DAY_FIRST_RE = re.compile(r'(\d{1,2})([./-])(\d{1,2})\2(\d{4})')
+_ISO_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+_RO_MONTHS = {
+    'ianuarie': 1, 'februarie': 2, 'martie': 3, 'aprilie': 4,
+    'mai': 5, 'iunie': 6, 'iulie': 7, 'august': 8,
+    'septembrie': 9, 'octombrie': 10, 'noiembrie': 11, 'decembrie': 12,
+}
+
+
+@lru_cache(maxsize=512)
+def parse_date(date_str: str) -> Optional[datetime]:
+    """Parse various Romanian date formats"""
+    # Try named month format: "15 aprilie 2026"
+    match = _NAMED_MONTH_RE.match(date_str)
+    if match:
+        day, month_name, year = match.groups()
+        month = _RO_MONTHS.get(month_name.lower())
+        if month:
+            try:
+                return datetime(int(year), month, int(day))
+            except ValueError:
+                pass
+
+    # Try numeric formats: day-first, then ISO
+    match = _DAY_FIRST_RE.fullmatch(date_str)
+    if match:
+        day, _, month, year = match.groups()
+    else:
+        match = _ISO_RE.fullmatch(date_str)
+        if not match:
+            return None
+        year, month, day = match.groups()
+
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
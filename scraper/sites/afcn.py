@@ -1,21 +1,50 @@
 """Scraper for AFCN - Administratia Fondului Cultural National"""
 
 import logging
-import hashlib
+from functools import lru_cache
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from datetime import datetime
+from scraper.session import create_session, prune_cache
+from scraper.sites._base import (
+    LINKS_ONLY, fetch_listings, fetch_page_details, fill_details, url_id,
+)
+from typing import List, Dict
 import re
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _session() -> requests.Session:
+    """AFCN session, created on first use"""
+    return create_session({
+        'User-Agent': 'Mozilla/5.0 (compatible; QUB-Funding-Scraper/1.0)'
+    }, cache_name='afcn')
+
+
 BASE_URLS = [
     "https://www.afcn.ro/programe/proiecte-culturale",
     "https://www.afcn.ro/programe/proiecte-editoriale",
     "https://www.afcn.ro",
 ]
 
+# Romanian deadline patterns, tried in order
+_DEADLINE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:termen|data)\s*(?:limita|limită)\s*[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}\s+\w+\s+\d{4})',
+    r'sesiune.*?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+]]
+
+# Link filters
+_SKIP_HREF_RE = re.compile('|'.join(map(re.escape, [
+    '#', '/wp-content/', '/feed/', 'javascript:',
+    'facebook.com', 'twitter.com', '/login',
+])))
+_FUNDING_KW_RE = re.compile('|'.join([
+    'program', 'proiect', 'sesiune', 'finantare', 'fonduri',
+    'apel', 'concurs', 'grant', 'cultural', 'editorial',
+]), re.IGNORECASE)
+
 
 def scrape() -> List[Dict]:
     """
@@ -24,15 +53,14 @@ def scrape() -> List[Dict]:
     jobs = []
     seen_urls = set()
 
-    for page_url in BASE_URLS:
+    listings = fetch_listings(_session(), BASE_URLS)
+
+    for page_url, listing in zip(BASE_URLS, listings):
         try:
-            logger.info(f"Fetching {page_url}")
-            response = requests.get(page_url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; QUB-Funding-Scraper/1.0)'
-            })
+            response = listing.result()
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup(response.text, 'lxml', parse_only=LINKS_ONLY)
 
             # Find all internal links that look like funding programs
             links = soup.find_all('a', href=True)
@@ -51,10 +79,7 @@ def scrape() -> List[Dict]:
                     continue
 
                 # Skip navigation/utility links
-                if any(skip in href for skip in [
-                    '#', '/wp-content/', '/feed/', 'javascript:',
-                    'facebook.com', 'twitter.com', '/login',
-                ]):
+                if _SKIP_HREF_RE.search(href):
                     continue
 
                 if href in seen_urls:
@@ -65,12 +90,9 @@ def scrape() -> List[Dict]:
                     continue
 
                 # Focus on funding-related pages
-                if any(kw in href.lower() or kw in title.lower() for kw in [
-                    'program', 'proiect', 'sesiune', 'finantare', 'fonduri',
-                    'apel', 'concurs', 'grant', 'cultural', 'editorial',
-                ]):
+                if _FUNDING_KW_RE.search(href) or _FUNDING_KW_RE.search(title):
                     seen_urls.add(href)
-                    fund_id = hashlib.md5(href.encode()).hexdigest()[:12]
+                    fund_id = url_id(href)
 
                     jobs.append({
                         'id': f"afcn_{fund_id}",
@@ -89,73 +111,13 @@ def scrape() -> List[Dict]:
 
     # Fetch details for funding pages
     logger.info(f"Found {len(jobs)} AFCN items, fetching details...")
-    for job in jobs[:20]:
-        details = fetch_details(job['url'])
-        if details['deadline']:
-            job['deadline'] = details['deadline']
-            job['deadline_date'] = details['deadline_date']
-        if details['description']:
-            job['description'] = details['description']
+    detail_jobs = jobs[:20]
+    fill_details(detail_jobs, fetch_details)
+    prune_cache(_session())
 
     return jobs
 
 
 def fetch_details(url: str) -> Dict:
     """Fetch page details for deadline and description"""
-    result = {'deadline': None, 'deadline_date': None, 'description': ''}
-    try:
-        response = requests.get(url, timeout=15, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; QUB-Funding-Scraper/1.0)'
-        })
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
-        text = soup.get_text(' ', strip=True)
-
-        result['description'] = ' '.join(text.split())[:3000]
-
-        # Romanian deadline patterns
-        deadline_patterns = [
-            r'(?:termen|data)\s*(?:limita|limită)\s*[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}\s+\w+\s+\d{4})',
-            r'sesiune.*?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-        ]
-
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(1)
-                result['deadline'] = date_str
-                result['deadline_date'] = parse_date(date_str)
-                break
-
-        return result
-    except Exception as e:
-        logger.debug(f"Could not fetch details from {url}: {e}")
-        return result
-
-
-def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse date string"""
-    ro_months = {
-        'ianuarie': '01', 'februarie': '02', 'martie': '03', 'aprilie': '04',
-        'mai': '05', 'iunie': '06', 'iulie': '07', 'august': '08',
-        'septembrie': '09', 'octombrie': '10', 'noiembrie': '11', 'decembrie': '12',
-    }
-
-    match = re.match(r'(\d{1,2})\s+(\w+)\s+(\d{4})', date_str)
-    if match:
-        day, month_name, year = match.groups()
-        month_num = ro_months.get(month_name.lower())
-        if month_num:
-            try:
-                return datetime(int(year), int(month_num), int(day))
-            except ValueError:
-                pass
-
-    for fmt in ['%d.%m.%Y', '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    return None
+    return fetch_page_details(_session(), url, _DEADLINE_PATTERNS)
@@ -1,21 +1,55 @@
 """Scraper for finantare.ro - Romanian funding opportunities aggregator"""
 
 import logging
-import hashlib
+from functools import lru_cache
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from datetime import datetime
+from scraper.session import create_session, prune_cache
+from scraper.sites._base import (
+    LINKS_ONLY, fetch_listings, fetch_page_details, fill_details, url_id,
+)
+from typing import List, Dict
 import re
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _session() -> requests.Session:
+    """finantare.ro session, created on first use"""
+    return create_session({
+        'User-Agent': 'Mozilla/5.0 (compatible; QUB-Funding-Scraper/1.0)'
+    }, cache_name='finantare_ro')
+
+
 BASE_URL = "https://www.finantare.ro"
 PAGES = [
     f"{BASE_URL}/fonduri-nerambursabile.html",
     f"{BASE_URL}/",
 ]
 
+_ARTICLE_URL_RE = re.compile(r'https://www\.finantare\.ro/[a-z0-9-]+/$')
+_PREV_NEXT_RE = re.compile(r'^(Previous|Next)(Previous|Next)?\s*post:')
+
+# Navigation, category, and non-article links
+_SKIP_HREF_RE = re.compile('|'.join(map(re.escape, [
+    '/category/', '/tag/', '/page/', '/author/',
+    '#', '/wp-content/', '/feed/', '/contact',
+    'facebook.com', 'twitter.com', '/despre-noi',
+    '/wp-login', '/wp-admin',
+])))
+_NAV_TITLES = frozenset(['acasa', 'home', 'contact', 'despre noi', 'mai multe'])
+
+# Romanian deadline patterns, tried in order
+_DEADLINE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:termen|data)\s*(?:limita|limită)\s*[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}\s+\w+\s+\d{4})',
+    r'(?:inscrieri|înscrieri)\s*(?:până|pana)\s*(?:la|pe)\s*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:inscrieri|înscrieri)\s*(?:până|pana)\s*(?:la|pe)\s*(\d{1,2}\s+\w+\s+\d{4})',
+    r'deadline[:\s]+(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+]]
+
 
 def scrape() -> List[Dict]:
     """
@@ -33,15 +67,14 @@ def scrape() -> List[Dict]:
     jobs = []
     seen_urls = set()
 
-    for page_url in PAGES:
+    listings = fetch_listings(_session(), PAGES)
+
+    for page_url, listing in zip(PAGES, listings):
         try:
-            logger.info(f"Fetching {page_url}")
-            response = requests.get(page_url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; QUB-Funding-Scraper/1.0)'
-            })
+            response = listing.result()
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup(response.text, 'lxml', parse_only=LINKS_ONLY)
 
             # Find all article links on finantare.ro
             # The site uses panel-grid-cell containers with article links
@@ -57,16 +90,11 @@ def scrape() -> List[Dict]:
                     href = BASE_URL + href
 
                 # Skip navigation, category, and non-article links
-                if any(skip in href for skip in [
-                    '/category/', '/tag/', '/page/', '/author/',
-                    '#', '/wp-content/', '/feed/', '/contact',
-                    'facebook.com', 'twitter.com', '/despre-noi',
-                    '/wp-login', '/wp-admin',
-                ]):
+                if _SKIP_HREF_RE.search(href):
                     continue
 
                 # Must be an .html article or a clean URL article
-                if not (href.endswith('.html') or re.match(r'https://www\.finantare\.ro/[a-z0-9-]+/$', href)):
+                if not (href.endswith('.html') or _ARTICLE_URL_RE.match(href)):
                     continue
 
                 if href in seen_urls:
@@ -77,16 +105,16 @@ def scrape() -> List[Dict]:
                     continue
 
                 # Skip if title looks like navigation
-                if title.lower() in ['acasa', 'home', 'contact', 'despre noi', 'mai multe']:
+                if title.lower() in _NAV_TITLES:
                     continue
 
                 # Clean up title - remove Previous/Next post prefixes
-                title = re.sub(r'^(Previous|Next)(Previous|Next)?\s*post:', '', title).strip()
+                title = _PREV_NEXT_RE.sub('', title).strip()
                 if not title or len(title) < 10:
                     continue
 
                 seen_urls.add(href)
-                fund_id = hashlib.md5(href.encode()).hexdigest()[:12]
+                fund_id = url_id(href)
 
                 jobs.append({
                     'id': f"finantare_ro_{fund_id}",
@@ -105,86 +133,26 @@ def scrape() -> List[Dict]:
 
     # Fetch details for each article (deadline + description)
     logger.info(f"Found {len(jobs)} articles, fetching details...")
-    for job in jobs[:30]:  # Limit to 30 to avoid rate-limiting
-        details = fetch_article_details(job['url'])
-        if details['deadline']:
-            job['deadline'] = details['deadline']
-            job['deadline_date'] = details['deadline_date']
-        if details['description']:
-            job['description'] = details['description']
+    detail_jobs = jobs[:30]  # Limit to 30 to avoid rate-limiting
+    fill_details(detail_jobs, fetch_article_details)
+    prune_cache(_session())
 
     return jobs
 
 
 def fetch_article_details(url: str) -> Dict:
     """Fetch article page to extract deadline and description"""
-    result = {'deadline': None, 'deadline_date': None, 'description': ''}
-    try:
-        response = requests.get(url, timeout=15, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; QUB-Funding-Scraper/1.0)'
-        })
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        # Get article body text for keyword matching
-        article = soup.find('div', class_='articlebody') or soup.find('article') or soup.find('div', class_='entry-content')
-        if article:
-            text = article.get_text(' ', strip=True)
-        else:
-            text = soup.get_text(' ', strip=True)
-
-        result['description'] = ' '.join(text.split())[:3000]
-
-        # Search for deadline patterns in Romanian
-        deadline_patterns = [
-            r'(?:termen|data)\s*(?:limita|limită)\s*[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}\s+\w+\s+\d{4})',
-            r'(?:inscrieri|înscrieri)\s*(?:până|pana)\s*(?:la|pe)\s*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(?:inscrieri|înscrieri)\s*(?:până|pana)\s*(?:la|pe)\s*(\d{1,2}\s+\w+\s+\d{4})',
-            r'deadline[:\s]+(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-        ]
-
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(1)
-                result['deadline'] = date_str
-                result['deadline_date'] = parse_date(date_str)
-                break
-
-        return result
-    except Exception as e:
-        logger.debug(f"Could not fetch details from {url}: {e}")
-        return result
-
-
-def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse various Romanian date formats"""
-    # Map Romanian month names
-    ro_months = {
-        'ianuarie': '01', 'februarie': '02', 'martie': '03', 'aprilie': '04',
-        'mai': '05', 'iunie': '06', 'iulie': '07', 'august': '08',
-        'septembrie': '09', 'octombrie': '10', 'noiembrie': '11', 'decembrie': '12',
-    }
-
-    # Try named month format: "15 aprilie 2026"
-    match = re.match(r'(\d{1,2})\s+(\w+)\s+(\d{4})', date_str)
-    if match:
-        day, month_name, year = match.groups()
-        month_num = ro_months.get(month_name.lower())
-        if month_num:
-            try:
-                return datetime(int(year), int(month_num), int(day))
-            except ValueError:
-                pass
-
-    # Try numeric formats
-    for fmt in ['%d.%m.%Y', '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-
+    return fetch_page_details(_session(), url, _DEADLINE_PATTERNS, find_content=find_article)
+
+
+def find_article(root):
+    """First article body container, in order of preference"""
+    for el in root.find_class('articlebody'):
+        if el.tag == 'div':
+            return el
+    for el in root.iter('article'):
+        return el
+    for el in root.find_class('entry-content'):
+        if el.tag == 'div':
+            return el
     return None
@@ -1,17 +1,59 @@
 """Scraper for fonduri-structurale.ro - EU structural funds for Romania"""
 
 import logging
-import hashlib
+from functools import lru_cache
+import orjson
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
+from bs4.element import CData, NavigableString, Tag
+from scraper.session import create_session, prune_cache
+from scraper.sites._dateparse import parse_date
+from scraper.sites._base import (
+    declared_encoding, fetch_listings, find_deadline, url_id,
+)
 from typing import List, Dict, Optional
-from datetime import datetime
 import re
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _session() -> requests.Session:
+    """fonduri-structurale.ro session, created on first use"""
+    return create_session({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
+    }, cache_name='fonduri_structurale')
+
+
 BASE_URL = "https://www.fonduri-structurale.ro"
 
+# Romanian deadline patterns, tried in order
+_DEADLINE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:termen|data)\s*(?:limita|limită)[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:până|pana)\s*(?:la|pe)\s*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'deadline[:\s]+(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+]]
+
+# Keys tried, in order, on __NEXT_DATA__ records
+_TITLE_KEYS = ('title', 'name', 'titlu')
+_URL_KEYS = ('url', 'link', 'slug')
+_DEADLINE_KEYS = ('deadline', 'termen', 'data_limita')
+
+# Funding keywords looked for in fallback link URLs
+_URL_KW_RE = re.compile('apel|finantare|grant|program', re.IGNORECASE)
+
+_HEADING_TAGS = frozenset(['h2', 'h3', 'h4'])
+
+# String types BeautifulSoup's get_text() reads; comments and script/style text are left out
+_TEXT_TYPES = (NavigableString, CData)
+
+# Funding call cards
+_CARD_SELECTOR = soupsieve.compile(
+    'article, .card, [class*="card"], [class*="apel"], [class*="call"], a[href*="/apel"]'
+)
+
 
 def scrape() -> List[Dict]:
     """
@@ -29,21 +71,18 @@ def scrape() -> List[Dict]:
         BASE_URL,
     ]
 
-    for page_url in urls_to_try:
+    listings = fetch_listings(_session(), urls_to_try)
+
+    for page_url, listing in zip(urls_to_try, listings):
         try:
-            logger.info(f"Fetching {page_url}")
-            response = requests.get(page_url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
-            })
+            response = listing.result()
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'lxml')
+            soup = BeautifulSoup(response.content, 'lxml', from_encoding=declared_encoding(response))
 
             # Try to find funding call cards/articles
             # Look for common patterns
-            cards = soup.select('article, .card, [class*="card"], [class*="apel"], [class*="call"], a[href*="/apel"]')
+            cards = _CARD_SELECTOR.select(soup)
 
             if not cards:
                 # Try finding any internal links that look like funding calls
@@ -56,7 +95,7 @@ def scrape() -> List[Dict]:
                         href = BASE_URL + href
 
                     # Filter for funding-related pages
-                    if not any(kw in href.lower() for kw in ['apel', 'finantare', 'grant', 'program']):
+                    if not _URL_KW_RE.search(href):
                         continue
 
                     if href in seen_urls:
@@ -67,7 +106,7 @@ def scrape() -> List[Dict]:
                         continue
 
                     seen_urls.add(href)
-                    fund_id = hashlib.md5(href.encode()).hexdigest()[:12]
+                    fund_id = url_id(href)
 
                     jobs.append({
                         'id': f"fonduri_structurale_{fund_id}",
@@ -88,38 +127,41 @@ def scrape() -> List[Dict]:
             # Also try to extract data from Next.js __NEXT_DATA__ script
             next_data = soup.find('script', id='__NEXT_DATA__')
             if next_data:
-                import json
                 try:
-                    data = json.loads(next_data.string)
+                    # orjson only accepts exact str, not bs4's NavigableString subclass
+                    data = orjson.loads(str(next_data.string))
                     props = data.get('props', {}).get('pageProps', {})
                     # Look for any list of items in the page props
-                    for key, value in props.items():
-                        if isinstance(value, list):
-                            for item in value:
-                                if isinstance(item, dict) and ('title' in item or 'name' in item or 'titlu' in item):
-                                    title = item.get('title') or item.get('name') or item.get('titlu', '')
-                                    url = item.get('url') or item.get('link') or item.get('slug', '')
-                                    if url and not url.startswith('http'):
-                                        url = f"{BASE_URL}/{url.lstrip('/')}"
-
-                                    if not title or url in seen_urls:
-                                        continue
-
-                                    seen_urls.add(url)
-                                    fund_id = hashlib.md5(url.encode()).hexdigest()[:12]
-
-                                    deadline = item.get('deadline') or item.get('termen') or item.get('data_limita')
-
-                                    jobs.append({
-                                        'id': f"fonduri_structurale_{fund_id}",
-                                        'title': title,
-                                        'url': url,
-                                        'deadline': deadline,
-                                        'deadline_date': parse_date(deadline) if deadline else None,
-                                        'source': 'fonduri_structurale',
-                                        'description': item.get('description', item.get('descriere', ''))[:3000]
-                                    })
-                except (json.JSONDecodeError, KeyError):
+                    for value in props.values():
+                        # Lists hold one kind of record, so one without a title key rules out the rest
+                        if not isinstance(value, list) or not value or not is_titled(value[0]):
+                            continue
+                        for item in value:
+                            if not is_titled(item):
+                                continue
+                            title = first_value(item, _TITLE_KEYS, '')
+                            url = first_value(item, _URL_KEYS, '')
+                            if url and not url.startswith('http'):
+                                url = f"{BASE_URL}/{url.lstrip('/')}"
+
+                            if not title or url in seen_urls:
+                                continue
+
+                            seen_urls.add(url)
+                            fund_id = url_id(url)
+
+                            deadline = first_value(item, _DEADLINE_KEYS)
+
+                            jobs.append({
+                                'id': f"fonduri_structurale_{fund_id}",
+                                'title': title,
+                                'url': url,
+                                'deadline': deadline,
+                                'deadline_date': parse_date(deadline) if deadline else None,
+                                'source': 'fonduri_structurale',
+                                'description': item.get('description', item.get('descriere', ''))[:3000]
+                            })
+                except (orjson.JSONDecodeError, KeyError):
                     pass
 
         except requests.RequestException as e:
@@ -128,12 +170,43 @@ def scrape() -> List[Dict]:
             logger.error(f"Error parsing {page_url}: {e}")
 
     logger.info(f"Found {len(jobs)} EU structural fund opportunities")
+    prune_cache(_session())
     return jobs
 
 
+def is_titled(item) -> bool:
+    """Whether a __NEXT_DATA__ record looks like a funding call (a dict with a title key)"""
+    return isinstance(item, dict) and any(key in item for key in _TITLE_KEYS)
+
+
+def first_value(item: Dict, keys: tuple, default=None):
+    """First truthy value among keys of a __NEXT_DATA__ record"""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return default
+
+
 def parse_card(card) -> Optional[Dict]:
     """Parse a funding card element"""
-    link = card.find('a', href=True)
+    # A single walk over the card finds the first link, heading and paragraph and gathers its text
+    link = title_elem = desc_elem = None
+    strings = []
+    for node in card.descendants:
+        if isinstance(node, Tag):
+            if node.name == 'a':
+                if link is None and node.has_attr('href'):
+                    link = node
+            elif node.name in _HEADING_TAGS:
+                if title_elem is None:
+                    title_elem = node
+            elif node.name == 'p':
+                if desc_elem is None:
+                    desc_elem = node
+        elif type(node) in _TEXT_TYPES:
+            strings.append(node)
+
     if not link and card.name == 'a':
         link = card
 
@@ -148,19 +221,17 @@ def parse_card(card) -> Optional[Dict]:
     else:
         url = href
 
-    title_elem = card.find(['h2', 'h3', 'h4'])
     title = title_elem.get_text(strip=True) if title_elem else link.get_text(strip=True)
 
     if not title or len(title) < 5:
         return None
 
-    fund_id = hashlib.md5(url.encode()).hexdigest()[:12]
+    fund_id = url_id(url)
 
     # Try to find deadline
-    text = card.get_text()
+    text = ''.join(strings)
     deadline, deadline_date = parse_deadline_text(text)
 
-    desc_elem = card.find('p')
     description = desc_elem.get_text(strip=True)[:200] if desc_elem else ''
 
     return {
@@ -174,30 +245,11 @@ def parse_card(card) -> Optional[Dict]:
     }
 
 
+@lru_cache(maxsize=512)
 def parse_deadline_text(text: str) -> tuple:
     """Parse deadline from Romanian text"""
-    patterns = [
-        r'(?:termen|data)\s*(?:limita|limită)[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-        r'(?:până|pana)\s*(?:la|pe)\s*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-        r'deadline[:\s]+(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            date_str = match.group(1)
-            return date_str, parse_date(date_str)
+    date_str = find_deadline(_DEADLINE_PATTERNS, text)
+    if date_str:
+        return date_str, parse_date(date_str)
 
     return None, None
-
-
-def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse date string"""
-    if not date_str:
-        return None
-    for fmt in ['%d.%m.%Y', '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    return None
@@ -1,20 +1,50 @@
 """Scraper for NGO Hub / Code for Romania ecosystem - funding opportunities"""
 
 import logging
-import hashlib
+from functools import lru_cache
 import requests
-from bs4 import BeautifulSoup
+from scraper.session import create_session, prune_cache
+from scraper.sites._base import (
+    declared_encoding, fetch_listings, fetch_page_details, fill_details, text_root, url_id,
+)
 from typing import List, Dict, Optional
-from datetime import datetime
 import re
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _session() -> requests.Session:
+    """NGO Hub session, created on first use"""
+    return create_session({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
+    }, cache_name='ngohub')
+
+
 BASE_URLS = [
     "https://ngohub.ro",
     "https://www.eurodesk.ro",
 ]
 
+# Romanian deadline patterns, tried in order
+_DEADLINE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:termen|data)\s*(?:limita|limită)\s*[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'deadline[:\s]+(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    r'deadline[:\s]+(\d{4}-\d{2}-\d{2})',
+]]
+
+# Link filters
+_SKIP_HREF_RE = re.compile('|'.join(map(re.escape, [
+    '#', 'javascript:', '.pdf', '.doc',
+    'facebook.com', 'twitter.com', 'linkedin.com',
+])))
+_FUNDING_KW_RE = re.compile('|'.join([
+    'grant', 'finantare', 'finantar', 'fond', 'funding',
+    'apel', 'program', 'concurs', 'burs', 'sponsoriz',
+]), re.IGNORECASE)
+
 
 def scrape() -> List[Dict]:
     """
@@ -23,18 +53,17 @@ def scrape() -> List[Dict]:
     jobs = []
     seen_urls = set()
 
-    for base_url in BASE_URLS:
+    listings = fetch_listings(_session(), BASE_URLS)
+
+    for base_url, listing in zip(BASE_URLS, listings):
         try:
-            logger.info(f"Fetching {base_url}")
-            response = requests.get(base_url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ro-RO,ro;q=0.9,en;q=0.8',
-            })
+            response = listing.result()
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'lxml')
-            links = soup.find_all('a', href=True)
+            # Anchors are read straight from lxml's tree, without bs4 wrappers per node;
+            # script/style/template are stripped so link titles hold only visible text
+            root = text_root(response.content, declared_encoding(response))
+            links = root.xpath('//a[@href]')
 
             for link in links:
                 href = link.get('href', '')
@@ -45,27 +74,20 @@ def scrape() -> List[Dict]:
                     continue
 
                 # Skip external/utility links
-                if any(skip in href for skip in [
-                    '#', 'javascript:', '.pdf', '.doc',
-                    'facebook.com', 'twitter.com', 'linkedin.com',
-                ]):
+                if _SKIP_HREF_RE.search(href):
                     continue
 
                 if href in seen_urls:
                     continue
 
-                title = link.get_text(strip=True)
+                title = ''.join(chunk.strip() for chunk in link.itertext())
                 if not title or len(title) < 10:
                     continue
 
                 # Focus on funding/grant pages
-                combined = (href + ' ' + title).lower()
-                if any(kw in combined for kw in [
-                    'grant', 'finantare', 'finantar', 'fond', 'funding',
-                    'apel', 'program', 'concurs', 'burs', 'sponsoriz',
-                ]):
+                if _FUNDING_KW_RE.search(href) or _FUNDING_KW_RE.search(title):
                     seen_urls.add(href)
-                    fund_id = hashlib.md5(href.encode()).hexdigest()[:12]
+                    fund_id = url_id(href)
 
                     jobs.append({
                         'id': f"ngohub_{fund_id}",
@@ -84,50 +106,13 @@ def scrape() -> List[Dict]:
 
     # Fetch details
     logger.info(f"Found {len(jobs)} NGO Hub items, fetching details...")
-    for job in jobs[:20]:
-        details = fetch_details(job['url'])
-        if details['deadline']:
-            job['deadline'] = details['deadline']
-            job['deadline_date'] = details['deadline_date']
-        if details['description']:
-            job['description'] = details['description']
+    detail_jobs = jobs[:20]
+    fill_details(detail_jobs, fetch_details)
+    prune_cache(_session())
 
     return jobs
 
 
 def fetch_details(url: str) -> Dict:
     """Fetch page details"""
-    result = {'deadline': None, 'deadline_date': None, 'description': ''}
-    try:
-        response = requests.get(url, timeout=15, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
-        text = soup.get_text(' ', strip=True)
-        result['description'] = ' '.join(text.split())[:3000]
-
-        deadline_patterns = [
-            r'(?:termen|data)\s*(?:limita|limită)\s*[:\s]*(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'(?:până|pana)\s*(?:la|pe|in|în)\s*(?:data\s+de\s+)?(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'deadline[:\s]+(\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            r'deadline[:\s]+(\d{4}-\d{2}-\d{2})',
-        ]
-
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(1)
-                result['deadline'] = date_str
-                for fmt in ['%d.%m.%Y', '%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                    try:
-                        result['deadline_date'] = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                break
-
-        return result
-    except Exception as e:
-        logger.debug(f"Could not fetch details from {url}: {e}")
-        return result
+    return fetch_page_details(_session(), url, _DEADLINE_PATTERNS)